@@ -5,17 +5,20 @@ A Python library for automated trading on Polymarket prediction markets,
 designed for speed, reliability, and safety.
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "Polymarket Execution Engine"
 
-from .config import PolymarketConfig
-from .trader import (
-    OrderError,
-    PolymarketTrader,
-    TradingConnectionError,
-    TradingError,
-    ValidationError,
-)
+if TYPE_CHECKING:
+    from .config import PolymarketConfig
+    from .trader import (
+        OrderError,
+        PolymarketTrader,
+        TradingConnectionError,
+        TradingError,
+        ValidationError,
+    )
 
 __all__ = [
     "PolymarketConfig",
@@ -25,3 +28,32 @@ __all__ = [
     "OrderError",
     "TradingError",
 ]
+
+# Map each public name to the submodule that defines it so we can resolve
+# attributes lazily without importing the trading stack at package import.
+_LAZY_ATTRS = {
+    "PolymarketConfig": "config",
+    "PolymarketTrader": "trader",
+    "ValidationError": "trader",
+    "TradingConnectionError": "trader",
+    "OrderError": "trader",
+    "TradingError": "trader",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import public attributes on first access (PEP 562).
+
+    Keeps `import polymarket_execution` cheap so CLI startup does not pay
+    for the py_clob_client dependency graph until a trader is actually used.
+    """
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    attr = getattr(module, name)
+    globals()[name] = attr  # Cache so __getattr__ only runs once per name
+    return attr
@@ -2,29 +2,22 @@
 Command-line interface for Polymarket Order Engine.
 """
 
-import argparse
 import logging
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from dotenv import load_dotenv
+from .config import load_env
+from .utils.logging import _make_handler
 
-from .config import PolymarketConfig
-from .trader import PolymarketTrader, TradingConnectionError, ValidationError
-from .utils import setup_logger
+if TYPE_CHECKING:
+    import argparse
 
+    from .trader import PolymarketTrader
 
-def create_parser() -> argparse.ArgumentParser:
-    """
-    Create and configure the argument parser.
 
-    Returns:
-        argparse.ArgumentParser: Configured parser
-    """
-    parser = argparse.ArgumentParser(
-        description="Polymarket Execution Engine - High-speed order execution for prediction markets",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Built once at module load and shared between the argparse epilog and the
+# static no-arg help text.
+_EPILOG = """
 Trading Examples:
     # Place a buy order
     polymarket-execute trade --token-id "12345" --price 0.60 --size 10.0
@@ -42,13 +35,26 @@ Environment Variables Required:
 
 Optional Safety Settings:
     POLYMARKET_MAX_ORDER_SIZE - Maximum order size (default: 1000.0)
-        """,
-    )
+"""
 
-    # Add subcommands
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+# Pre-baked help text for the bare `polymarket-execute` invocation, so the
+# no-arg path never has to import argparse (and its gettext/textwrap graph).
+_STATIC_HELP = """\
+usage: polymarket-execute [-h] {trade} ...
+
+Polymarket Execution Engine - High-speed order execution for prediction markets
+
+positional arguments:
+  {trade}     Available commands
+    trade     Place a trade order
+
+options:
+  -h, --help  show this help message and exit
+""" + _EPILOG
 
-    # Trade command
+
+def _build_trade_parser(subparsers: Any) -> None:
+    """Register the trade subcommand and its arguments."""
     trade_parser = subparsers.add_parser("trade", help="Place a trade order")
     trade_parser.add_argument(
         "--token-id", required=True, help="Token ID of the market to trade"
@@ -74,6 +80,33 @@ Optional Safety Settings:
         help="Simulate the trade without actually placing it",
     )
 
+
+# Subcommand name -> builder, so new commands register in one place.
+_SUBCOMMAND_BUILDERS = {
+    "trade": _build_trade_parser,
+}
+
+
+def create_parser() -> "argparse.ArgumentParser":
+    """
+    Create and configure the argument parser.
+
+    Returns:
+        argparse.ArgumentParser: Configured parser
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Polymarket Execution Engine - High-speed order execution for prediction markets",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
+    )
+
+    # Add subcommands
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    for build in _SUBCOMMAND_BUILDERS.values():
+        build(subparsers)
+
     return parser
 
 
@@ -104,24 +137,27 @@ def validate_trade_args(args: Any) -> bool:
 
 def setup_logging() -> None:
     """Setup logging configuration."""
-    # Get root logger and configure it using shared utility
+    # LogRecord construction skips getpid()/current_thread() lookups when
+    # these are off; no CLI output format uses them. This is process-global
+    # state, so it is only touched here where the process is ours, never in
+    # library code.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # Configure the root logger directly with a shared handler
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
 
     # Clear existing handlers to avoid duplicates
     root_logger.handlers.clear()
+    root_logger.addHandler(_make_handler())
 
-    # Use shared setup_logger but configure as root logger
-    temp_logger = setup_logger("temp")
-
-    # Transfer the handler from temp logger to root logger
-    if temp_logger.handlers:
-        root_logger.addHandler(temp_logger.handlers[0])
-        temp_logger.handlers.clear()
 
-
-def handle_trade_command(args: Any, trader: PolymarketTrader) -> bool:
+def handle_trade_command(args: Any, trader: "PolymarketTrader") -> bool:
     """Handle trade command execution."""
+    from .trader import TradingConnectionError, ValidationError
+
     side = getattr(args, "side", "buy")
 
     if args.dry_run:
@@ -170,8 +206,15 @@ def handle_trade_command(args: Any, trader: PolymarketTrader) -> bool:
 
 def main() -> None:
     """Main CLI entry point."""
-    # Load environment variables
-    load_dotenv()
+    # Fast path: bare invocation just prints help, no argparse needed
+    if len(sys.argv) == 1:
+        print(_STATIC_HELP)
+        return
+
+    # Load environment variables once per process; load_env's lru_cache
+    # means repeated invocations (tests, REPL, library use) skip the
+    # .env re-parse entirely.
+    load_env()
 
     parser = create_parser()
     args = parser.parse_args()
@@ -184,10 +227,16 @@ def main() -> None:
         parser.print_help()
         return
 
+    # Import the trading stack only once a real command is running, so
+    # --help and argument errors never pay for py_clob_client.
+    from .config import PolymarketConfig
+    from .trader import PolymarketTrader
+
     # Initialize configuration
     print("Initializing configuration...")
     config = PolymarketConfig()
-    if not config.validate():
+    # The CLI only reports failure and exits, so stop at the first error
+    if not config.validate(fail_fast=True):
         sys.exit(1)
 
     # Initialize trader
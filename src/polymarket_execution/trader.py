@@ -3,51 +3,130 @@ Polymarket trading functionality.
 """
 
 import re
+import threading
 import time
 from functools import wraps
-from typing import Any, Callable, Dict, Optional
-
-try:
-    from py_clob_client.client import ClobClient
-    from py_clob_client.clob_types import OrderArgs, OrderType
-    from py_clob_client.exceptions import PolyApiException
-    from py_clob_client.order_builder.constants import BUY, SELL
-except ImportError as e:
-    raise ImportError(
-        f"Missing required dependencies: {e}\n"
-        "Please install with: pip install py-clob-client"
-    )
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from py_clob_client.client import ClobClient as _ClobClientT
 
 from .config import PolymarketConfig
 from .utils import setup_logger
 
+
+class _PyClobClientNotLoaded(Exception):
+    """Placeholder exception used before py_clob_client is lazily imported."""
+
+    pass
+
+
+# py_clob_client pulls in a large network/crypto dependency graph, so the
+# import is deferred until a client is actually constructed. These globals
+# are populated by _load_py_clob_client() on first use.
+ClobClient: Any = None
+OrderArgs: Any = None
+OrderType: Any = None
+PolyApiException: Any = _PyClobClientNotLoaded
+BUY: Any = None
+SELL: Any = None
+
+
+def _load_py_clob_client() -> None:
+    """Import py_clob_client on first use, keeping module import cheap."""
+    global ClobClient, OrderArgs, OrderType, PolyApiException, BUY, SELL
+
+    if ClobClient is not None:
+        return
+
+    try:
+        from py_clob_client.client import ClobClient as _clob_client
+        from py_clob_client.clob_types import OrderArgs as _order_args
+        from py_clob_client.clob_types import OrderType as _order_type
+        from py_clob_client.exceptions import PolyApiException as _poly_api_exception
+        from py_clob_client.order_builder.constants import BUY as _buy
+        from py_clob_client.order_builder.constants import SELL as _sell
+    except ImportError as e:
+        raise ImportError(
+            f"Missing required dependencies: {e}\n"
+            "Please install with: pip install py-clob-client"
+        )
+
+    ClobClient = _clob_client
+    OrderArgs = _order_args
+    OrderType = _order_type
+    PolyApiException = _poly_api_exception
+    BUY = _buy
+    SELL = _sell
+
+
 # Retry constants
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0
 
+# Compiled once: token validation sits on the hot order-placement path
+_TOKEN_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+# Set (e.g. from a signal handler) to abort any in-progress retry backoff
+_retry_abort = threading.Event()
+
+
+def _wait_for_retry(seconds: float) -> None:
+    """Wait out a retry backoff, waking early if the abort event is set.
+
+    The wait is chunked so an abort (or Ctrl-C) is noticed within ~100 ms
+    rather than after the full backoff interval.
+    """
+    deadline = time.monotonic() + seconds
+    while not _retry_abort.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        _retry_abort.wait(timeout=min(remaining, 0.1))
+
+
+def _default_retry_exceptions() -> tuple:
+    """Exceptions considered transient and worth retrying.
+
+    Resolved at call time rather than decoration time so the lazily
+    imported PolyApiException is picked up once py_clob_client is loaded.
+    """
+    return (TradingConnectionError, PolyApiException, ConnectionError, TimeoutError)
+
 
 def retry_on_failure(
-    max_retries: int = DEFAULT_MAX_RETRIES, delay: float = DEFAULT_RETRY_DELAY
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    delay: float = DEFAULT_RETRY_DELAY,
+    retry_on: Optional[tuple] = None,
 ) -> Callable:
-    """Decorator to retry operations on failure."""
+    """
+    Decorator to retry transient failures with exponential backoff.
+
+    Non-transient errors (validation, bad credentials, missing imports)
+    raise immediately instead of burning seconds of backoff sleep on an
+    operation that can never succeed.
+    """
 
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            last_exception: Optional[Exception] = None
+            retriable = (
+                retry_on if retry_on is not None else _default_retry_exceptions()
+            )
+            backoff = delay
 
             for attempt in range(max_retries):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries - 1:
-                        time.sleep(delay * (2**attempt))  # Exponential backoff
-                        continue
-                    break
-
-            if last_exception is not None:
-                raise last_exception
+                except retriable:
+                    if attempt >= max_retries - 1:
+                        raise
+                    _wait_for_retry(backoff)
+                    if _retry_abort.is_set():
+                        raise
+                    backoff *= 2
+
             raise RuntimeError(
                 "Unexpected error: no exception occurred but retry failed"
             )
@@ -96,10 +175,18 @@ class PolymarketTrader:
             config: PolymarketConfig instance with trading parameters
         """
         self.config = config
-        self.client: Optional[ClobClient] = None
+        self.client: Optional["_ClobClientT"] = None
 
         self.logger = setup_logger(f"{__name__}.{self.__class__.__name__}")
-        self._trading_limits = config.get_trading_limits()
+
+        # Unpack limits once so the per-order hot path reads plain
+        # attributes
+        limits = config.get_trading_limits()
+        self._min_price = limits.min_price
+        self._min_order_size = limits.min_order_size
+        self._max_order_size = limits.max_order_size
+        self._max_total = self.MAX_PRICE * self._max_order_size
+
         self._is_initialized = False
 
     @retry_on_failure(max_retries=DEFAULT_MAX_RETRIES, delay=DEFAULT_RETRY_DELAY)
@@ -110,6 +197,8 @@ class PolymarketTrader:
         Returns:
             bool: True if initialization successful, False otherwise
         """
+        _load_py_clob_client()
+
         try:
             self.logger.info("Initializing Polymarket client...")
 
@@ -127,9 +216,14 @@ class PolymarketTrader:
             api_creds = self.client.create_or_derive_api_creds()
             self.client.set_api_creds(api_creds)
 
-            # Test connection with a simple API call
+            # Resolve the CLOB hostname now so the first request doesn't
+            # pay an uncontrolled DNS lookup on the order path
+            self._prewarm_dns()
+
+            # Test connection with a simple API call; this also warms the
+            # persistent connection so the first order reuses it
             self.logger.info("Testing connection...")
-            # TODO: Add actual connection test if API provides one
+            self._warm_connection()
 
             # Mark as initialized
             self._is_initialized = True
@@ -137,17 +231,54 @@ class PolymarketTrader:
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to initialize client: {e}")
+            self.logger.error("Failed to initialize client: %s", e)
             self._is_initialized = False
             return False
 
+    def _prewarm_dns(self) -> None:
+        """
+        Resolve the CLOB hostname to warm the OS resolver cache.
+
+        Moves tens of ms of DNS latency from the first order into
+        initialization, where time is cheap. Best effort: failure must
+        never block initialization.
+        """
+        import socket
+        from urllib.parse import urlparse
+
+        hostname = urlparse(self.config.host).hostname
+        if not hostname:
+            return
+
+        try:
+            socket.getaddrinfo(hostname, 443, type=socket.SOCK_STREAM)
+        except OSError as e:
+            self.logger.warning("DNS pre-resolution failed: %s", e)
+
+    def _warm_connection(self) -> None:
+        """
+        Establish the HTTP connection to the CLOB ahead of the first order.
+
+        py_clob_client keeps a persistent keep-alive httpx client (HTTP/2),
+        so a cheap request here pays the TCP+TLS handshake at init time
+        instead of on the first order. Best effort: failure must never
+        block initialization.
+        """
+        if self.client is None:
+            return
+
+        try:
+            self.client.get_ok()
+        except Exception as e:
+            self.logger.warning("Connection warm-up failed: %s", e)
+
     def _validate_token_id(self, token_id: str) -> bool:
         """Validate token ID format."""
         if not token_id or not isinstance(token_id, str):
             return False
 
         # Basic validation - should be alphanumeric
-        return bool(re.match(r"^[a-zA-Z0-9_-]+$", token_id))
+        return bool(_TOKEN_RE.match(token_id))
 
     def _validate_order_params(
         self, price: float, size: float, side: str = "BUY"
@@ -163,9 +294,16 @@ class PolymarketTrader:
         Raises:
             ValidationError: If parameters are invalid
         """
-        limits = self._trading_limits
-
-        # Validate parameter types
+        # Bind limits to locals up front; the checks below then run on
+        # LOAD_FAST instead of repeated attribute/dict access
+        min_price = self._min_price
+        min_size = self._min_order_size
+        max_size = self._max_order_size
+        max_total = self._max_total
+        max_price = self.MAX_PRICE
+
+        # Validate parameter types; isinstance keeps numeric subclasses
+        # (e.g. numpy scalars) acceptable, as the public contract promises
         if not isinstance(price, (int, float)) or price <= 0:
             raise ValidationError("Price must be a positive number")
 
@@ -173,26 +311,21 @@ class PolymarketTrader:
             raise ValidationError("Size must be a positive number")
 
         # Validate price ranges
-        if price < limits["min_price"]:
-            raise ValidationError(f"Price {price} below minimum {limits['min_price']}")
+        if price < min_price:
+            raise ValidationError(f"Price {price} below minimum {min_price}")
 
-        if price > self.MAX_PRICE:
-            raise ValidationError(f"Price {price} exceeds maximum {self.MAX_PRICE}")
+        if price > max_price:
+            raise ValidationError(f"Price {price} exceeds maximum {max_price}")
 
         # Validate size ranges
-        if size < limits["min_order_size"]:
-            raise ValidationError(
-                f"Size {size} below minimum {limits['min_order_size']}"
-            )
+        if size < min_size:
+            raise ValidationError(f"Size {size} below minimum {min_size}")
 
-        if size > limits["max_order_size"]:
-            raise ValidationError(
-                f"Size {size} exceeds maximum {limits['max_order_size']}"
-            )
+        if size > max_size:
+            raise ValidationError(f"Size {size} exceeds maximum {max_size}")
 
         # Validate total cost
         total_cost = price * size
-        max_total = self.MAX_PRICE * limits["max_order_size"]
         if total_cost > max_total:
             raise ValidationError(
                 f"Total cost {total_cost} exceeds safety limit {max_total}"
@@ -231,66 +364,122 @@ class PolymarketTrader:
         """
         return self._place_order(token_id, price, size, SELL)
 
-    def _place_order(self, token_id: str, price: float, size: float, side: str) -> bool:
+    def prepare_order(self, token_id: str, price: float, size: float, side: str) -> Any:
         """
-        Internal method to place orders with comprehensive error handling.
+        Validate and sign an order without submitting it.
+
+        Latency-sensitive callers can prepare (validate + sign) ahead of
+        time and keep only the network POST on the critical path via
+        submit_order().
+
+        Args:
+            token_id: The token ID of the market to trade
+            price: Price per token in USDC (0.0 to 1.0)
+            size: Number of tokens to trade
+            side: Order side (BUY/SELL)
+
+        Returns:
+            The signed order, ready for submit_order()
+
+        Raises:
+            ValidationError: If parameters are invalid
+            TradingConnectionError: If client is not initialized
         """
         if not self._is_initialized or not self.client:
             raise TradingConnectionError("Client not initialized")
 
-        # Start execution timing for speed measurement
-        execution_start = time.time()
-
-        try:
-            # Validate inputs
-            if not self._validate_token_id(token_id):
-                raise ValidationError(f"Invalid token ID: {token_id}")
+        # Validate inputs
+        if not self._validate_token_id(token_id):
+            raise ValidationError(f"Invalid token ID: {token_id}")
+
+        self._validate_order_params(price, size, side)
+
+        # One record pre-send; per-step detail is DEBUG so the critical
+        # path only takes the handler lock twice per order
+        self.logger.info(
+            "Placing %s order %s@%s token=%s total=%s USDC",
+            side,
+            size,
+            price,
+            token_id,
+            price * size,
+        )
+
+        # Create and sign the order
+        order_args = OrderArgs(price=price, size=size, side=side, token_id=token_id)
+        self.logger.debug("Creating and signing order...")
+        return self.client.create_order(order_args)
+
+    def submit_order(self, signed_order: Any) -> bool:
+        """
+        Submit a previously prepared (signed) order.
 
-            self._validate_order_params(price, size, side)
+        Args:
+            signed_order: Signed order from prepare_order()
 
-            # Log order details
-            self.logger.info(f"Placing {side} order:")
-            self.logger.info(f"  Token ID: {token_id}")
-            self.logger.info(f"  Price: {price} USDC")
-            self.logger.info(f"  Size: {size} tokens")
-            self.logger.info(f"  Total: {price * size} USDC")
+        Returns:
+            bool: True if order was placed successfully, False otherwise
 
-            # Create order arguments
-            order_args = OrderArgs(price=price, size=size, side=side, token_id=token_id)
+        Raises:
+            TradingConnectionError: If client is not initialized
+        """
+        if not self._is_initialized or not self.client:
+            raise TradingConnectionError("Client not initialized")
 
-            # Create and sign the order
-            self.logger.info("Creating and signing order...")
-            signed_order = self.client.create_order(order_args)
+        # Start execution timing for speed measurement; only the network
+        # POST is on the clock here. perf_counter_ns is monotonic, so the
+        # reported latency can't be skewed by NTP steps mid-order.
+        execution_start = time.perf_counter_ns()
 
-            # Place the order
-            self.logger.info("Executing order...")
+        try:
+            self.logger.debug("Executing order...")
             response = self.client.post_order(signed_order, OrderType.GTC)
 
             # Calculate execution time and log success
-            execution_time = (time.time() - execution_start) * 1000
+            execution_time = (time.perf_counter_ns() - execution_start) / 1_000_000
             self.logger.info(
-                f"Order executed successfully! (took {execution_time:.0f}ms)"
+                "Order executed successfully! id=%s (took %.0fms)",
+                response.get("orderID", "N/A"),
+                execution_time,
             )
-            self.logger.info(f"Order ID: {response.get('orderID', 'N/A')}")
 
             return True
 
-        except ValidationError as e:
-            self.logger.error(f"Validation error: {e}")
-            return False
         except PolyApiException as e:
-            execution_time = (time.time() - execution_start) * 1000
+            execution_time = (time.perf_counter_ns() - execution_start) / 1_000_000
             self.logger.error(
-                f"API error placing order: {e} (attempted in {execution_time:.0f}ms)"
+                "API error placing order: %s (attempted in %.0fms)",
+                e,
+                execution_time,
             )
             return False
         except Exception as e:
-            execution_time = (time.time() - execution_start) * 1000
+            execution_time = (time.perf_counter_ns() - execution_start) / 1_000_000
             self.logger.error(
-                f"Unexpected error placing order: {e} (attempted in {execution_time:.0f}ms)"
+                "Unexpected error placing order: %s (attempted in %.0fms)",
+                e,
+                execution_time,
             )
             return False
 
+    def _place_order(self, token_id: str, price: float, size: float, side: str) -> bool:
+        """
+        Internal method to place orders with comprehensive error handling.
+        """
+        try:
+            signed_order = self.prepare_order(token_id, price, size, side)
+        except ValidationError as e:
+            self.logger.error("Validation error: %s", e)
+            return False
+        except TradingError:
+            # Connection problems keep propagating as before
+            raise
+        except Exception as e:
+            self.logger.error("Unexpected error preparing order: %s", e)
+            return False
+
+        return self.submit_order(signed_order)
+
     def get_order_status(self, order_id: str) -> Optional[Dict[str, Any]]:
         """
         Get the status of an order.
@@ -306,10 +495,10 @@ class PolymarketTrader:
 
         try:
             # TODO: Implement actual order status retrieval
-            self.logger.info(f"Getting status for order: {order_id}")
+            self.logger.info("Getting status for order: %s", order_id)
             return {"order_id": order_id, "status": "unknown"}
         except Exception as e:
-            self.logger.error(f"Failed to get order status: {e}")
+            self.logger.error("Failed to get order status: %s", e)
             return None
 
     def cancel_order(self, order_id: str) -> bool:
@@ -326,9 +515,9 @@ class PolymarketTrader:
             raise TradingConnectionError("Client not initialized")
 
         try:
-            self.logger.info(f"Cancelling order: {order_id}")
+            self.logger.info("Cancelling order: %s", order_id)
             # TODO: Implement actual order cancellation
             return True
         except Exception as e:
-            self.logger.error(f"Failed to cancel order {order_id}: {e}")
+            self.logger.error("Failed to cancel order %s: %s", order_id, e)
             return False
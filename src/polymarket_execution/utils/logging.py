@@ -4,6 +4,34 @@ import logging
 import time
 
 
+class UTCFormatter(logging.Formatter):
+    """Formatter emitting UTC timestamps with microsecond precision."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        # Cache the whole-second prefix so burst logging within the
+        # same second skips gmtime/strftime entirely
+        self._last_sec = -1
+        self._last_prefix = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._last_sec = sec
+        microseconds = int((record.created - sec) * 1_000_000)
+        return f"{self._last_prefix}.{microseconds:06d}Z"
+
+
+def _make_handler() -> logging.Handler:
+    """Build a StreamHandler configured with the UTC formatter."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        UTCFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    return handler
+
+
 def setup_logger(name: str) -> logging.Logger:
     """
     Set up logging configuration.
@@ -11,24 +39,15 @@ def setup_logger(name: str) -> logging.Logger:
     Returns:
         logging.Logger: Configured logger instance
     """
-
-    # Create custom formatter for UTC timestamps with microseconds
-    class UTCFormatter(logging.Formatter):
-        def formatTime(
-            self, record: logging.LogRecord, datefmt: str | None = None
-        ) -> str:
-            dt = time.gmtime(record.created)
-            microseconds = int((record.created % 1) * 1_000_000)
-            return time.strftime("%Y-%m-%dT%H:%M:%S", dt) + f".{microseconds:06d}Z"
-
-    # Configure logging with custom formatter
-    handler = logging.StreamHandler()
-    formatter = UTCFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    handler.setFormatter(formatter)
-
-    # Set up logger instance
+    # Set up logger instance; repeated calls for the same name (e.g. one
+    # per trader instance) must not stack duplicate handlers, which would
+    # print every record N times
     logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+
     logger.setLevel(logging.INFO)
-    logger.addHandler(handler)
+    logger.addHandler(_make_handler())
+    logger.propagate = False  # Avoid double-logging through the root logger
 
     return logger
@@ -0,0 +1,31 @@
+"""Shared pytest fixtures for the test suite."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _no_dotenv():
+    """Disable .env parsing for the whole session.
+
+    Tests control their environment explicitly and must never pay (or
+    depend on) a dotenv scan of the working directory.
+    """
+    with patch("polymarket_execution.cli.load_env", lambda *a, **k: False):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Neutralize blocking waits so retry/backoff paths can never stall
+    the suite; covers both time.sleep and the trader's abortable wait."""
+    monkeypatch.setattr("time.sleep", lambda *_: None)
+    monkeypatch.setattr("polymarket_execution.trader._wait_for_retry", lambda *_: None)
+
+
+@pytest.fixture(autouse=True)
+def _no_dns(monkeypatch):
+    """Stub DNS resolution so the trader's pre-warm never issues a real
+    getaddrinfo syscall, which can stall for the resolver timeout."""
+    monkeypatch.setattr("socket.getaddrinfo", lambda *a, **k: [])
@@ -1,39 +1,60 @@
 """Tests for the CLI module."""
 
-from unittest.mock import Mock, patch
+from contextlib import ExitStack
+from unittest.mock import patch
 
 import pytest
 
 from polymarket_execution.cli import create_parser, main
 
-
-class TestCLI:
-    """Test suite for CLI functionality."""
-
-    def test_create_parser(self):
-        """Test parser creation and argument configuration."""
-        parser = create_parser()
-
-        # Test no arguments - should show help, not fail
-        args = parser.parse_args([])
-        assert args.command is None
-
-        # Test valid trade command
-        args = parser.parse_args(
-            ["trade", "--token-id", "123", "--price", "0.6", "--size", "10.0"]
-        )
-
-        assert args.token_id == "123"
-        assert args.price == 0.6
-        assert args.size == 10.0
-        assert args.dry_run is False
-        assert args.command == "trade"
-
-    def test_create_parser_with_dry_run(self):
-        """Test parser with dry-run flag."""
-        parser = create_parser()
-
-        args = parser.parse_args(
+# Shared argv shapes, built once as immutable tuples; tests convert to a
+# list at the patch site instead of repeating near-identical literals.
+_BASE_ARGV = (
+    "polymarket-execute",
+    "trade",
+    "--token-id",
+    "123",
+    "--price",
+    "0.6",
+    "--size",
+    "10.0",
+)
+_DRY_RUN_ARGV = (*_BASE_ARGV, "--dry-run")
+
+
+def _run_main_capture() -> int:
+    """Run main() and return its exit code directly, avoiding the
+    pytest.raises(SystemExit) machinery in every CLI test."""
+    try:
+        main()
+        return 0
+    except SystemExit as e:
+        return int(e.code or 0)
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """Build the argument parser once for the whole module; parse_args
+    does not mutate the registered actions, so sharing is safe."""
+    return create_parser()
+
+
+@pytest.mark.parametrize(
+    "argv,check",
+    [
+        # No arguments - should show help, not fail
+        ([], lambda a: a.command is None),
+        # Valid trade command with defaults
+        (
+            ["trade", "--token-id", "123", "--price", "0.6", "--size", "10.0"],
+            lambda a: a.command == "trade"
+            and a.token_id == "123"
+            and a.price == 0.6
+            and a.size == 10.0
+            and a.dry_run is False,
+        ),
+        # Dry-run flag
+        (
             [
                 "trade",
                 "--token-id",
@@ -43,180 +64,74 @@ class TestCLI:
                 "--size",
                 "10.0",
                 "--dry-run",
-            ]
+            ],
+            lambda a: a.dry_run is True,
+        ),
+    ],
+)
+def test_parse_args(parser, argv, check):
+    """Test argument parsing across the supported argv shapes."""
+    assert check(parser.parse_args(argv))
+
+
+@pytest.fixture
+def cli_env():
+    """Patch the CLI's collaborators once; tests tweak return values."""
+    with ExitStack() as stack:
+        mock_config_cls = stack.enter_context(
+            patch("polymarket_execution.config.PolymarketConfig")
         )
-
-        assert args.dry_run is True
-
-    @patch("polymarket_execution.cli.load_dotenv")
-    @patch("polymarket_execution.cli.PolymarketConfig")
-    @patch("polymarket_execution.cli.PolymarketTrader")
-    @patch(
-        "sys.argv",
-        [
-            "polymarket-execute",
-            "trade",
-            "--token-id",
-            "123",
-            "--price",
-            "0.6",
-            "--size",
-            "10.0",
-            "--dry-run",
-        ],
-    )
-    def test_main_dry_run(self, mock_trader, mock_config, _):
-        """Test main function with dry-run mode."""
-        # Setup mocks
-        mock_config_instance = Mock()
-        mock_config_instance.validate.return_value = True
-        mock_config_instance.get_trading_limits.return_value = {
-            "max_order_size": 1000.0,
-            "min_price": 0.01,
-            "min_order_size": 0.1,
-        }
-        mock_config.return_value = mock_config_instance
-
-        mock_trader_instance = Mock()
-        mock_trader_instance._validate_order_params.return_value = None
-        mock_trader.return_value = mock_trader_instance
-
-        with patch("builtins.print") as mock_print:
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-
-        assert exc_info.value.code == 0
-        # Verify dry-run output
-        mock_print.assert_any_call("DRY RUN MODE - No actual trades will be placed")
-        mock_print.assert_any_call("Would place BUY order:")
-
-    @patch("polymarket_execution.cli.load_dotenv")
-    @patch("polymarket_execution.cli.PolymarketConfig")
-    @patch(
-        "sys.argv",
-        [
-            "polymarket-execute",
-            "trade",
-            "--token-id",
-            "123",
-            "--price",
-            "0.6",
-            "--size",
-            "10.0",
-        ],
-    )
-    def test_main_config_validation_failure(self, mock_config, _):
-        """Test main function with config validation failure."""
-        # Setup mocks
-        mock_config_instance = Mock()
-        mock_config_instance.validate.return_value = False
-        mock_config.return_value = mock_config_instance
-
-        with pytest.raises(SystemExit) as exc_info:
-            main()
-
-        assert exc_info.value.code == 1
-
-    @patch("polymarket_execution.cli.load_dotenv")
-    @patch("polymarket_execution.cli.PolymarketConfig")
-    @patch("polymarket_execution.cli.PolymarketTrader")
-    @patch(
-        "sys.argv",
-        [
-            "polymarket-execute",
-            "trade",
-            "--token-id",
-            "123",
-            "--price",
-            "0.6",
-            "--size",
-            "10.0",
-        ],
-    )
-    def test_main_client_init_failure(self, mock_trader, mock_config, _):
-        """Test main function with client initialization failure."""
-        # Setup mocks
-        mock_config_instance = Mock()
-        mock_config_instance.validate.return_value = True
-        mock_config.return_value = mock_config_instance
-
-        mock_trader_instance = Mock()
-        mock_trader_instance.initialize_client.return_value = False
-        mock_trader.return_value = mock_trader_instance
-
-        with pytest.raises(SystemExit) as exc_info:
-            with patch("builtins.print") as mock_print:
-                main()
-
-        assert exc_info.value.code == 1
-        mock_print.assert_called_with("Failed to initialize trading client")
-
-    @patch("polymarket_execution.cli.load_dotenv")
-    @patch("polymarket_execution.cli.PolymarketConfig")
-    @patch("polymarket_execution.cli.PolymarketTrader")
-    @patch(
-        "sys.argv",
-        [
-            "polymarket-execute",
-            "trade",
-            "--token-id",
-            "123",
-            "--price",
-            "0.6",
-            "--size",
-            "10.0",
-        ],
-    )
-    def test_main_successful_trade(self, mock_trader, mock_config, _):
-        """Test main function with successful trade."""
-        # Setup mocks
-        mock_config_instance = Mock()
-        mock_config_instance.validate.return_value = True
-        mock_config.return_value = mock_config_instance
-
-        mock_trader_instance = Mock()
-        mock_trader_instance.initialize_client.return_value = True
-        mock_trader_instance.place_buy_order.return_value = True
-        mock_trader.return_value = mock_trader_instance
-
-        with patch("builtins.print") as mock_print:
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-
-        assert exc_info.value.code == 0
-        mock_print.assert_called_with("Trade executed successfully!")
-
-    @patch("polymarket_execution.cli.load_dotenv")
-    @patch("polymarket_execution.cli.PolymarketConfig")
-    @patch("polymarket_execution.cli.PolymarketTrader")
-    @patch(
-        "sys.argv",
-        [
-            "polymarket-execute",
-            "trade",
-            "--token-id",
-            "123",
-            "--price",
-            "0.6",
-            "--size",
-            "10.0",
-        ],
-    )
-    def test_main_failed_trade(self, mock_trader, mock_config, _):
-        """Test main function with failed trade."""
-        # Setup mocks
-        mock_config_instance = Mock()
-        mock_config_instance.validate.return_value = True
-        mock_config.return_value = mock_config_instance
-
-        mock_trader_instance = Mock()
-        mock_trader_instance.initialize_client.return_value = True
-        mock_trader_instance.place_buy_order.return_value = False
-        mock_trader.return_value = mock_trader_instance
-
-        with pytest.raises(SystemExit) as exc_info:
-            with patch("builtins.print") as mock_print:
-                main()
-
-        assert exc_info.value.code == 1
-        mock_print.assert_called_with("Failed to execute trade")
+        mock_trader_cls = stack.enter_context(
+            patch("polymarket_execution.trader.PolymarketTrader")
+        )
+        yield mock_config_cls.return_value, mock_trader_cls.return_value
+
+
+@pytest.mark.parametrize(
+    "argv,validate_ret,init_ret,order_ret,expected_code,expected_msgs",
+    [
+        # Dry run: validates parameters without placing a trade
+        (
+            _DRY_RUN_ARGV,
+            True,
+            True,
+            None,
+            0,
+            (
+                "DRY RUN MODE - No actual trades will be placed",
+                "Would place BUY order:",
+            ),
+        ),
+        # Config validation failure exits before the trader is built
+        (_BASE_ARGV, False, True, None, 1, ()),
+        # Client initialization failure
+        (_BASE_ARGV, True, False, None, 1, ("Failed to initialize trading client",)),
+        # Successful trade
+        (_BASE_ARGV, True, True, True, 0, ("Trade executed successfully!",)),
+        # Failed trade
+        (_BASE_ARGV, True, True, False, 1, ("Failed to execute trade",)),
+    ],
+)
+def test_main(
+    cli_env,
+    capsys,
+    argv,
+    validate_ret,
+    init_ret,
+    order_ret,
+    expected_code,
+    expected_msgs,
+):
+    """Test main across the config/init/trade outcome matrix."""
+    mock_config, mock_trader = cli_env
+    mock_config.validate.return_value = validate_ret
+    mock_trader.initialize_client.return_value = init_ret
+    mock_trader.place_buy_order.return_value = order_ret
+    mock_trader._validate_order_params.return_value = None
+
+    with patch("sys.argv", list(argv)):
+        assert _run_main_capture() == expected_code
+
+    captured = capsys.readouterr().out
+    for msg in expected_msgs:
+        assert msg in captured
@@ -1,103 +1,98 @@
 """Tests for the PolymarketConfig class."""
 
 import os
-from unittest.mock import patch
 
-from polymarket_execution.config import PolymarketConfig
-
-
-class TestPolymarketConfig:
-    """Test suite for PolymarketConfig."""
-
-    def test_init_default_values(self):
-        """Test that default values are set correctly."""
-        config = PolymarketConfig()
-
-        assert config.host == "https://clob.polymarket.com"
-        assert config.chain_id == 137
-        assert config.signature_type == 1
-
-    @patch.dict(
-        os.environ,
-        {
-            "POLYMARKET_PRIVATE_KEY": "test_key",
-            "POLYMARKET_PROXY_ADDRESS": "test_address",
-            "POLYMARKET_SIGNATURE_TYPE": "2",
-        },
-    )
-    def test_init_with_env_vars(self):
-        """Test initialization with environment variables."""
-        config = PolymarketConfig()
-
-        assert config.private_key == "test_key"
-        assert config.proxy_address == "test_address"
-        assert config.signature_type == 2
+import pytest
 
-    @patch.dict(
-        os.environ,
-        {
-            "POLYMARKET_PRIVATE_KEY": "0x" + "a" * 64,
-            "POLYMARKET_PROXY_ADDRESS": "0x" + "b" * 40,
-        },
-    )
-    def test_validate_success(self):
-        """Test successful validation."""
-        config = PolymarketConfig()
+from polymarket_execution.config import PolymarketConfig
 
-        assert config.validate()
+# Built once at module load instead of re-concatenated per test/decorator
+_VALID_PK = "0x" + "a" * 64
+_VALID_ADDR = "0x" + "b" * 40
+_BASE_ENV = {
+    "POLYMARKET_PRIVATE_KEY": _VALID_PK,
+    "POLYMARKET_PROXY_ADDRESS": _VALID_ADDR,
+}
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_signature_type_default(self):
-        """Test that signature type defaults to 1 when not set."""
-        config = PolymarketConfig()
 
-        assert config.signature_type == 1
+def _set_env(monkeypatch, env, clear=False):
+    """Apply env via per-key monkeypatch instead of a full os.environ copy."""
+    if clear:
+        monkeypatch.setattr(os, "environ", {})
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
 
-    @patch.dict(os.environ, {"POLYMARKET_SIGNATURE_TYPE": "invalid"})
-    def test_signature_type_invalid(self):
-        """Test handling of invalid signature type."""
-        config = PolymarketConfig()
-        # Should default to 1 when invalid value provided
-        assert config.signature_type == 1
 
-    @patch.dict(
-        os.environ,
-        {
-            "POLYMARKET_PRIVATE_KEY": "0x" + "a" * 64,
-            "POLYMARKET_PROXY_ADDRESS": "0x" + "b" * 40,
-            "POLYMARKET_MAX_ORDER_SIZE": "500.0",
-        },
-    )
-    def test_trading_limits(self):
-        """Test trading limits configuration."""
-        config = PolymarketConfig()
-        limits = config.get_trading_limits()
+def test_init_default_values():
+    """Test that default values are set correctly."""
+    config = PolymarketConfig()
 
-        assert limits["max_order_size"] == 500.0
+    assert config.host == "https://clob.polymarket.com"
+    assert config.chain_id == 137
+    assert config.signature_type == 1
 
-        assert limits["min_price"] == 0.01
-        assert limits["min_order_size"] == 0.1
 
-    @patch.dict(
-        os.environ,
+def test_init_with_env_vars(monkeypatch):
+    """Test initialization with environment variables."""
+    _set_env(
+        monkeypatch,
         {
-            "POLYMARKET_PRIVATE_KEY": "invalid_key",
-            "POLYMARKET_PROXY_ADDRESS": "0x" + "b" * 40,
+            "POLYMARKET_PRIVATE_KEY": "test_key",
+            "POLYMARKET_PROXY_ADDRESS": "test_address",
+            "POLYMARKET_SIGNATURE_TYPE": "2",
         },
     )
-    def test_validate_invalid_private_key(self):
-        """Test validation with invalid private key."""
-        config = PolymarketConfig()
-        assert not config.validate()
 
-    @patch.dict(
-        os.environ,
-        {
-            "POLYMARKET_PRIVATE_KEY": "0x" + "a" * 64,
-            "POLYMARKET_PROXY_ADDRESS": "invalid_address",
-        },
-    )
-    def test_validate_invalid_proxy_address(self):
-        """Test validation with invalid proxy address."""
-        config = PolymarketConfig()
-        assert not config.validate()
+    config = PolymarketConfig()
+
+    assert config.private_key == "test_key"
+    assert config.proxy_address == "test_address"
+    assert config.signature_type == 2
+
+
+@pytest.mark.parametrize(
+    "env,expected",
+    [
+        # Valid key and address
+        (_BASE_ENV, True),
+        # Invalid private key
+        ({**_BASE_ENV, "POLYMARKET_PRIVATE_KEY": "invalid_key"}, False),
+        # Invalid proxy address
+        ({**_BASE_ENV, "POLYMARKET_PROXY_ADDRESS": "invalid_address"}, False),
+    ],
+)
+@pytest.mark.parametrize("fail_fast", [False, True])
+def test_validate(monkeypatch, env, expected, fail_fast):
+    """Test validate() against valid and invalid credential sets."""
+    _set_env(monkeypatch, env, clear=True)
+    assert PolymarketConfig().validate(fail_fast=fail_fast) is expected
+
+
+@pytest.mark.parametrize(
+    "env,expected",
+    [
+        # Unset defaults to 1
+        ({}, 1),
+        # Invalid value falls back to 1
+        ({"POLYMARKET_SIGNATURE_TYPE": "invalid"}, 1),
+        # Explicit valid value is honoured
+        ({"POLYMARKET_SIGNATURE_TYPE": "2"}, 2),
+    ],
+)
+def test_signature_type(monkeypatch, env, expected):
+    """Test signature type parsing across unset/invalid/valid values."""
+    _set_env(monkeypatch, env, clear=True)
+    assert PolymarketConfig().signature_type == expected
+
+
+def test_trading_limits(monkeypatch):
+    """Test trading limits configuration."""
+    _set_env(monkeypatch, {**_BASE_ENV, "POLYMARKET_MAX_ORDER_SIZE": "500.0"})
+
+    config = PolymarketConfig()
+    limits = config.get_trading_limits()
+
+    assert limits.max_order_size == 500.0
+
+    assert limits.min_price == 0.01
+    assert limits.min_order_size == 0.1